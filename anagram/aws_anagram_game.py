@@ -26,13 +26,16 @@ def create_anagram(word):
     word_chars = list(word)
     random.shuffle(word_chars)
     
-    # Make sure the anagram is different from the original word
-    anagram = ''.join(word_chars)
-    while anagram == word and len(word) > 1:
-        random.shuffle(word_chars)
-        anagram = ''.join(word_chars)
+    # Make sure the anagram is different from the original word by swapping
+    # one pair of differing neighbours instead of reshuffling until it is
+    if ''.join(word_chars) == word:
+        swaps = [i for i in range(len(word_chars) - 1)
+                 if word_chars[i] != word_chars[i + 1]]
+        if swaps:
+            i = random.choice(swaps)
+            word_chars[i], word_chars[i + 1] = word_chars[i + 1], word_chars[i]
     
-    return anagram
+    return ''.join(word_chars)
 
 def play_game():
     """Main game function."""